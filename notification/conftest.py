@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+#pylint: disable = redefined-outer-name
+"""
+Shared pytest fixtures for notification_api.py tests
+"""
+
+import types
+from unittest.mock import MagicMock, patch
+import pytest
+import notification_api
+
+# Captured before _session_logger_mock replaces it for the session
+REAL_GET_LOGGER = notification_api.get_logger
+
+
+@pytest.fixture(scope="module")
+def smtp_es_config():
+    """Read-only SMTP and elasticsearch configuration, built once per module"""
+    return types.MappingProxyType({
+        "smtp.from": "sender@example.com",
+        "smtp.smtp_server": "smtp.example.com",
+        "smtp.smtp_port": 587,
+        "smtp.username": "user@example.com",
+        "smtp.password": "password123",
+        "elasticsearch.host": "localhost",
+        "elasticsearch.username": "elastic",
+        "elasticsearch.password": "password",
+        "elasticsearch.port": 9200,
+    })
+
+
+@pytest.fixture
+def mock_config(smtp_es_config):
+    """Configuration mock whose getProperty reads from smtp_es_config"""
+    config_content = MagicMock()
+    config_content.getProperty.side_effect = smtp_es_config.get
+    return config_content
+
+
+@pytest.fixture(scope="session")
+def es_mock_template():
+    """Elasticsearch class mock whose client returns no hits, built once per session"""
+    es_class = MagicMock()
+    es_class.return_value.search.return_value = {"hits": {"hits": []}}
+    return es_class
+
+
+@pytest.fixture
+def mock_elasticsearch(es_mock_template):
+    """Patch notification_api.Elasticsearch with the shared template and reset it afterwards"""
+    with patch.object(notification_api, "Elasticsearch", es_mock_template):
+        yield es_mock_template
+    es_client = es_mock_template.return_value
+    es_mock_template.reset_mock(side_effect=True)
+    es_client.search.reset_mock(return_value=True, side_effect=True)
+    es_client.search.return_value = {"hits": {"hits": []}}
+
+
+@pytest.fixture(scope="session")
+def emails_html_template():
+    """emails.html mock returning a message mock, built once per session"""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_emails_html(emails_html_template):
+    """Patch notification_api.emails with a namespace exposing the shared html template"""
+    with patch.object(notification_api, "emails", types.SimpleNamespace(html=emails_html_template)):
+        yield emails_html_template
+    message = emails_html_template.return_value
+    emails_html_template.reset_mock(side_effect=True)
+    message.send.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _session_logger_mock():
+    """Replace notification_api.get_logger with one logger mock for the whole session"""
+    logger = MagicMock()
+    with patch.object(notification_api, "get_logger", return_value=logger):
+        yield logger
+
+
+@pytest.fixture(autouse=True)
+def silent_logger(_session_logger_mock):
+    """Session logger mock, reset after every test"""
+    yield _session_logger_mock
+    _session_logger_mock.reset_mock()
+
+
+@pytest.fixture
+def real_logger(monkeypatch):
+    """Restore the real get_logger for tests of the logger itself"""
+    monkeypatch.setattr(notification_api, "get_logger", REAL_GET_LOGGER)
+
+
+@pytest.fixture(autouse=True)
+def _module_snapshot():
+    """Restore notification_api globals a test or a failed teardown left behind"""
+    namespace = vars(notification_api)
+    snapshot = dict(namespace)
+    yield
+    for name in set(namespace) - set(snapshot):
+        del namespace[name]
+    namespace.update(snapshot)
@@ -1,5 +1,5 @@
 #!/usr/bin/python3
-#pylint: disable = invalid-name, broad-except
+#pylint: disable = invalid-name, broad-except, global-statement, import-outside-toplevel
 """
 A notification application which runs on scheduled basis and send the information to users.
 Author:- Opstree Solutions
@@ -10,11 +10,13 @@ import os
 import sys
 import logging
 import time
-import emails
 import config_with_yaml as config
-from elasticsearch import Elasticsearch
 import schedule
 
+# emails and elasticsearch are imported on first use to keep module import cheap
+emails = None
+Elasticsearch = None
+
 CONFIG_FILE = os.environ.get("CONFIG_FILE")
 FORMATTER = logging.Formatter("%(asctime)s — %(name)s — %(levelname)s — %(message)s")
 
@@ -42,6 +44,9 @@ def read_configuration():
 
 def send_mail(email_id):
     """function which will send mail to user"""
+    global emails
+    if emails is None:
+        import emails
     logger = get_logger()
     config_content = read_configuration()
     try:
@@ -67,6 +72,9 @@ def send_mail(email_id):
 
 def send_mail_to_all_users():
     """This function will fetch user information from elasticsearch"""
+    global Elasticsearch
+    if Elasticsearch is None:
+        from elasticsearch import Elasticsearch
     logger = get_logger()
     config_content = read_configuration()
 
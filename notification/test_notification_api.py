@@ -6,470 +6,340 @@ Tests cover all major functions including logger initialization,
 configuration reading, email sending, and elasticsearch operations.
 """
 
-import unittest
 import logging
-import sys
-import os
-from unittest.mock import patch, MagicMock, call
+import argparse
+import runpy
+from unittest.mock import MagicMock
 import pytest
 import notification_api
 
 
-class TestLoggerInitialization(unittest.TestCase):
-    """Test cases for logger initialization functions"""
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_init_logger_returns_stream_handler(self):
-        """Test that init_logger returns a StreamHandler"""
-        handler = notification_api.init_logger()
-        self.assertIsInstance(handler, logging.StreamHandler)
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_init_logger_has_formatter(self):
-        """Test that init_logger applies formatter correctly"""
-        handler = notification_api.init_logger()
-        self.assertIsNotNone(handler.formatter)
-        self.assertIsInstance(handler.formatter, logging.Formatter)
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_get_logger_returns_logger_instance(self):
-        """Test that get_logger returns a Logger instance"""
-        logger = notification_api.get_logger()
-        self.assertIsInstance(logger, logging.Logger)
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_get_logger_name(self):
-        """Test that get_logger creates logger with correct name"""
-        logger = notification_api.get_logger()
-        self.assertEqual(logger.name, "notification-service")
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_get_logger_debug_level(self):
-        """Test that get_logger sets DEBUG level"""
-        logger = notification_api.get_logger()
-        self.assertEqual(logger.level, logging.DEBUG)
-
-    @pytest.mark.unit
-    @pytest.mark.logger
-    def test_get_logger_has_handler(self):
-        """Test that get_logger has at least one handler"""
-        logger = notification_api.get_logger()
-        self.assertGreater(len(logger.handlers), 0)
-
-
-class TestConfigurationReading(unittest.TestCase):
-    """Test cases for configuration reading functions"""
-
-    @pytest.mark.unit
-    @pytest.mark.config
-    @patch.dict(os.environ, {"CONFIG_FILE": "/path/to/config.yaml"})
-    @patch("notification_api.config.load")
-    def test_read_configuration_success(self, mock_config_load):
-        """Test successful configuration reading"""
-        mock_config = MagicMock()
-        mock_config_load.return_value = mock_config
-        
-        result = notification_api.read_configuration()
-        
-        self.assertEqual(result, mock_config)
-        mock_config_load.assert_called_once_with("/path/to/config.yaml")
-
-    @pytest.mark.unit
-    @pytest.mark.config
-    @patch.dict(os.environ, {"CONFIG_FILE": "/invalid/path.yaml"})
-    @patch("notification_api.config.load")
-    def test_read_configuration_exception(self, mock_config_load):
-        """Test configuration reading with exception"""
-        mock_config_load.side_effect = Exception("Config file not found")
-        
-        with patch("notification_api.get_logger") as mock_logger:
-            mock_logger_instance = MagicMock()
-            mock_logger.return_value = mock_logger_instance
-            
-            result = notification_api.read_configuration()
-            
-            mock_logger_instance.error.assert_called_once()
-
-    @pytest.mark.unit
-    @pytest.mark.config
-    @patch.dict(os.environ, {"CONFIG_FILE": ""})
-    def test_read_configuration_no_config_file_env(self):
-        """Test configuration reading when CONFIG_FILE env is not set"""
-        with patch("notification_api.config.load") as mock_config_load:
-            mock_config = MagicMock()
-            mock_config_load.return_value = mock_config
-            
-            result = notification_api.read_configuration()
-            
-            # Even if CONFIG_FILE is empty, it should be passed to load
-            mock_config_load.assert_called_once()
-
-
-class TestEmailFunctionality(unittest.TestCase):
-    """Test cases for email sending functions"""
-
-    @pytest.mark.unit
-    @pytest.mark.email
-    @patch("notification_api.read_configuration")
-    @patch("notification_api.emails.html")
-    def test_send_mail_success(self, mock_emails_html, mock_read_config):
-        """Test successful email sending"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "smtp.from": "sender@example.com",
-            "smtp.smtp_server": "smtp.example.com",
-            "smtp.smtp_port": 587,
-            "smtp.username": "user@example.com",
-            "smtp.password": "password123",
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_message = MagicMock()
-        mock_emails_html.return_value = mock_message
-        
-        notification_api.send_mail("recipient@example.com")
-        
-        mock_emails_html.assert_called_once()
-        mock_message.send.assert_called_once()
-
-    @pytest.mark.unit
-    @pytest.mark.email
-    @patch("notification_api.read_configuration")
-    @patch("notification_api.emails.html")
-    def test_send_mail_exception(self, mock_emails_html, mock_read_config):
-        """Test email sending with exception"""
-        mock_config = MagicMock()
-        mock_read_config.return_value = mock_config
-        mock_emails_html.side_effect = Exception("SMTP connection failed")
-        
-        with patch("notification_api.get_logger") as mock_logger:
-            mock_logger_instance = MagicMock()
-            mock_logger.return_value = mock_logger_instance
-            
-            notification_api.send_mail("recipient@example.com")
-            
-            mock_logger_instance.error.assert_called()
-
-    @pytest.mark.unit
-    @pytest.mark.email
-    @patch("notification_api.read_configuration")
-    @patch("notification_api.emails.html")
-    def test_send_mail_email_content(self, mock_emails_html, mock_read_config):
-        """Test that email has correct content"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "smtp.from": "sender@example.com",
-            "smtp.smtp_server": "smtp.example.com",
-            "smtp.smtp_port": 587,
-            "smtp.username": "user@example.com",
-            "smtp.password": "password123",
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_message = MagicMock()
-        mock_emails_html.return_value = mock_message
-        
-        notification_api.send_mail("recipient@example.com")
-        
-        # Verify email content
-        call_args = mock_emails_html.call_args
-        self.assertIn("Salary Slip", call_args.kwargs.get("subject", ""))
-        self.assertIn("salary slip", call_args.kwargs.get("html", ""))
-
-    @pytest.mark.unit
-    @pytest.mark.email
-    @patch("notification_api.read_configuration")
-    @patch("notification_api.emails.html")
-    def test_send_mail_smtp_configuration(self, mock_emails_html, mock_read_config):
-        """Test that SMTP configuration is passed correctly"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "smtp.from": "sender@example.com",
-            "smtp.smtp_server": "smtp.example.com",
-            "smtp.smtp_port": 587,
-            "smtp.username": "testuser",
-            "smtp.password": "testpass",
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_message = MagicMock()
-        mock_emails_html.return_value = mock_message
-        
-        notification_api.send_mail("recipient@example.com")
-        
-        # Verify SMTP config is correct
-        send_call_args = mock_message.send.call_args
-        smtp_config = send_call_args.kwargs.get("smtp", {})
-        self.assertEqual(smtp_config.get("host"), "smtp.example.com")
-        self.assertEqual(smtp_config.get("port"), 587)
-        self.assertEqual(smtp_config.get("user"), "testuser")
-        self.assertEqual(smtp_config.get("password"), "testpass")
-        self.assertTrue(smtp_config.get("tls"))
-
-
-class TestElasticsearchFunctionality(unittest.TestCase):
-    """Test cases for elasticsearch operations"""
-
-    @pytest.mark.unit
-    @pytest.mark.elasticsearch
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.send_mail")
-    @patch("notification_api.read_configuration")
-    def test_send_mail_to_all_users_success(self, mock_read_config, mock_send_mail, mock_elasticsearch):
-        """Test successful mail sending to all users from elasticsearch"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "elasticsearch.host": "localhost",
-            "elasticsearch.username": "elastic",
-            "elasticsearch.password": "password",
-            "elasticsearch.port": 9200,
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_es_instance = MagicMock()
-        mock_elasticsearch.return_value = mock_es_instance
-        mock_es_instance.search.return_value = {
-            "hits": {
-                "hits": [
-                    {"_source": {"email_id": "user1@example.com"}},
-                    {"_source": {"email_id": "user2@example.com"}},
-                ]
-            }
+# Logger initialization
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_init_logger_returns_stream_handler():
+    """Test that init_logger returns a StreamHandler"""
+    handler = notification_api.init_logger()
+    assert isinstance(handler, logging.StreamHandler)
+
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_init_logger_has_formatter():
+    """Test that init_logger applies formatter correctly"""
+    handler = notification_api.init_logger()
+    assert handler.formatter is not None
+    assert isinstance(handler.formatter, logging.Formatter)
+
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_get_logger_returns_logger_instance():
+    """Test that get_logger returns a Logger instance"""
+    logger = notification_api.get_logger()
+    assert isinstance(logger, logging.Logger)
+
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_get_logger_name():
+    """Test that get_logger creates logger with correct name"""
+    logger = notification_api.get_logger()
+    assert logger.name == "notification-service"
+
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_get_logger_debug_level():
+    """Test that get_logger sets DEBUG level"""
+    logger = notification_api.get_logger()
+    assert logger.level == logging.DEBUG
+
+
+@pytest.mark.unit
+@pytest.mark.logger
+@pytest.mark.usefixtures("real_logger")
+def test_get_logger_has_handler():
+    """Test that get_logger has at least one handler"""
+    logger = notification_api.get_logger()
+    assert len(logger.handlers) > 0
+
+
+# Configuration reading
+
+@pytest.mark.unit
+@pytest.mark.config
+def test_read_configuration_success(mocker):
+    """Test successful configuration reading"""
+    mocker.patch("notification_api.CONFIG_FILE", "/path/to/config.yaml")
+    mock_config = MagicMock()
+    mock_config_load = mocker.patch("notification_api.config.load", return_value=mock_config)
+
+    result = notification_api.read_configuration()
+
+    assert result == mock_config
+    mock_config_load.assert_called_once_with("/path/to/config.yaml")
+
+
+@pytest.mark.unit
+@pytest.mark.config
+def test_read_configuration_exception(mocker, silent_logger):
+    """Test configuration reading with exception"""
+    mocker.patch("notification_api.CONFIG_FILE", "/invalid/path.yaml")
+    mocker.patch("notification_api.config.load", side_effect=Exception("Config file not found"))
+
+    result = notification_api.read_configuration()
+
+    assert result is None
+    silent_logger.error.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.config
+def test_read_configuration_no_config_file_env(mocker):
+    """Test configuration reading when CONFIG_FILE env is not set"""
+    mocker.patch("notification_api.CONFIG_FILE", None)
+    mock_config_load = mocker.patch("notification_api.config.load")
+
+    notification_api.read_configuration()
+
+    # Even if CONFIG_FILE is not set, it should be passed to load
+    mock_config_load.assert_called_once_with(None)
+
+
+# Email sending
+
+@pytest.mark.unit
+@pytest.mark.email
+def test_send_mail_wiring(mocker, mock_config, smtp_es_config, mock_emails_html):
+    """Test that send_mail builds the salary slip mail and sends it over SMTP"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+
+    notification_api.send_mail("recipient@example.com")
+
+    # Verify email content
+    mock_emails_html.assert_called_once()
+    call_args = mock_emails_html.call_args
+    assert "Salary Slip" in call_args.kwargs["subject"]
+    assert "salary slip" in call_args.kwargs["html"]
+    assert call_args.kwargs["mail_from"] == smtp_es_config["smtp.from"]
+
+    # Verify SMTP config is correct
+    mock_message = mock_emails_html.return_value
+    mock_message.send.assert_called_once()
+    send_call_args = mock_message.send.call_args
+    assert send_call_args.kwargs["to"] == "recipient@example.com"
+    assert send_call_args.kwargs["smtp"] == {
+        "host": smtp_es_config["smtp.smtp_server"],
+        "port": smtp_es_config["smtp.smtp_port"],
+        "timeout": 5,
+        "user": smtp_es_config["smtp.username"],
+        "password": smtp_es_config["smtp.password"],
+        "tls": True,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.email
+def test_send_mail_exception(mocker, mock_config, mock_emails_html, silent_logger):
+    """Test email sending with exception"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+    mock_emails_html.side_effect = Exception("SMTP connection failed")
+
+    notification_api.send_mail("recipient@example.com")
+
+    silent_logger.error.assert_called()
+
+
+# Elasticsearch operations
+
+@pytest.mark.unit
+@pytest.mark.elasticsearch
+def test_send_mail_to_all_users_success(mocker, mock_config, mock_elasticsearch):
+    """Test successful mail sending to all users from elasticsearch"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+    mock_send_mail = mocker.patch("notification_api.send_mail")
+
+    mock_es_instance = mock_elasticsearch.return_value
+    mock_es_instance.search.return_value = {
+        "hits": {
+            "hits": [
+                {"_source": {"email_id": "user1@example.com"}},
+                {"_source": {"email_id": "user2@example.com"}},
+            ]
         }
-        
-        notification_api.send_mail_to_all_users()
-        
-        self.assertEqual(mock_send_mail.call_count, 2)
-        mock_send_mail.assert_any_call("user1@example.com")
-        mock_send_mail.assert_any_call("user2@example.com")
-
-    @pytest.mark.unit
-    @pytest.mark.elasticsearch
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.read_configuration")
-    def test_send_mail_to_all_users_elasticsearch_connection(self, mock_read_config, mock_elasticsearch):
-        """Test elasticsearch connection parameters"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "elasticsearch.host": "es.example.com",
-            "elasticsearch.username": "elastic_user",
-            "elasticsearch.password": "elastic_pass",
-            "elasticsearch.port": 9300,
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_es_instance = MagicMock()
-        mock_elasticsearch.return_value = mock_es_instance
-        mock_es_instance.search.return_value = {"hits": {"hits": []}}
-        
-        notification_api.send_mail_to_all_users()
-        
-        # Verify elasticsearch connection parameters
-        mock_elasticsearch.assert_called_once()
-        call_args = mock_elasticsearch.call_args
-        self.assertEqual(call_args[0][0], ["es.example.com"])
-
-    @pytest.mark.unit
-    @pytest.mark.elasticsearch
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.read_configuration")
-    def test_send_mail_to_all_users_query(self, mock_read_config, mock_elasticsearch):
-        """Test elasticsearch query parameters"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "elasticsearch.host": "localhost",
-            "elasticsearch.username": "elastic",
-            "elasticsearch.password": "password",
-            "elasticsearch.port": 9200,
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_es_instance = MagicMock()
-        mock_elasticsearch.return_value = mock_es_instance
-        mock_es_instance.search.return_value = {"hits": {"hits": []}}
-        
-        notification_api.send_mail_to_all_users()
-        
-        # Verify elasticsearch search query
-        mock_es_instance.search.assert_called_once()
-        search_call = mock_es_instance.search.call_args
-        self.assertEqual(search_call.kwargs.get("index"), "employee-management")
-
-    @pytest.mark.unit
-    @pytest.mark.elasticsearch
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.read_configuration")
-    def test_send_mail_to_all_users_exception(self, mock_read_config, mock_elasticsearch):
-        """Test exception handling in send_mail_to_all_users"""
-        mock_config = MagicMock()
-        mock_read_config.return_value = mock_config
-        mock_elasticsearch.side_effect = Exception("Connection refused")
-        
-        with patch("notification_api.get_logger") as mock_logger:
-            mock_logger_instance = MagicMock()
-            mock_logger.return_value = mock_logger_instance
-            
-            notification_api.send_mail_to_all_users()
-            
-            mock_logger_instance.error.assert_called()
-
-    @pytest.mark.unit
-    @pytest.mark.elasticsearch
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.send_mail")
-    @patch("notification_api.read_configuration")
-    def test_send_mail_to_all_users_empty_result(self, mock_read_config, mock_send_mail, mock_elasticsearch):
-        """Test handling empty elasticsearch results"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "elasticsearch.host": "localhost",
-            "elasticsearch.username": "elastic",
-            "elasticsearch.password": "password",
-            "elasticsearch.port": 9200,
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_es_instance = MagicMock()
-        mock_elasticsearch.return_value = mock_es_instance
-        mock_es_instance.search.return_value = {"hits": {"hits": []}}
-        
-        notification_api.send_mail_to_all_users()
-        
-        mock_send_mail.assert_not_called()
-
-
-class TestScheduleOperation(unittest.TestCase):
-    """Test cases for schedule operations"""
-
-    @pytest.mark.unit
-    @pytest.mark.schedule
-    @patch("notification_api.schedule.run_pending")
-    @patch("notification_api.schedule.every")
-    @patch("notification_api.time.sleep")
-    def test_schedule_operation_sets_hourly_schedule(self, mock_sleep, mock_every, mock_run_pending):
-        """Test that schedule_operation sets hourly schedule"""
-        mock_every_instance = MagicMock()
-        mock_every.return_value = mock_every_instance
-        
-        # Mock to stop the infinite loop after one iteration
-        mock_sleep.side_effect = KeyboardInterrupt()
-        
-        try:
-            notification_api.schedule_operation()
-        except KeyboardInterrupt:
-            pass
-        
-        mock_every.assert_called()
-        mock_every_instance.hour.do.assert_called_once_with(notification_api.send_mail_to_all_users)
-
-    @pytest.mark.unit
-    @pytest.mark.schedule
-    @patch("notification_api.get_logger")
-    @patch("notification_api.schedule.run_pending")
-    @patch("notification_api.schedule.every")
-    @patch("notification_api.time.sleep")
-    def test_schedule_operation_logging(self, mock_sleep, mock_every, mock_run_pending, mock_get_logger):
-        """Test that schedule_operation logs waiting message"""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-        mock_every_instance = MagicMock()
-        mock_every.return_value = mock_every_instance
-        
-        # Mock to stop after one iteration
-        mock_sleep.side_effect = KeyboardInterrupt()
-        
-        try:
-            notification_api.schedule_operation()
-        except KeyboardInterrupt:
-            pass
-        
-        mock_logger.info.assert_called()
-
-
-class TestMainArguments(unittest.TestCase):
-    """Test cases for main argument parsing"""
-
-    @patch("notification_api.schedule_operation")
-    def test_main_scheduled_mode(self, mock_schedule):
-        """Test main with scheduled mode"""
-        with patch("sys.argv", ["notification_api.py", "-m", "scheduled"]):
-            with patch("notification_api.schedule_operation") as mock_schedule_op:
-                mock_schedule_op.side_effect = KeyboardInterrupt()
-                try:
-                    exec(open(notification_api.__file__).read())
-                except:
-                    pass
-
-    @patch("notification_api.send_mail_to_all_users")
-    def test_main_external_mode(self, mock_send_all):
-        """Test main with external mode"""
-        with patch("sys.argv", ["notification_api.py", "-m", "external"]):
-            try:
-                # This would normally run send_mail_to_all_users
-                notification_api.send_mail_to_all_users()
-            except:
-                pass
-
-    def test_default_mode_is_scheduled(self):
-        """Test that default mode is 'scheduled'"""
-        import argparse
-        parser = argparse.ArgumentParser()
-        parser.add_argument("-m", "--mode", help="Mode", default="scheduled")
-        
-        # Test with no arguments
-        with patch("sys.argv", ["notification_api.py"]):
-            args = parser.parse_args([])
-            self.assertEqual(args.mode, "scheduled")
-
-
-class TestIntegration(unittest.TestCase):
-    """Integration tests combining multiple components"""
-
-    @pytest.mark.integration
-    @pytest.mark.smoke
-    @patch("notification_api.Elasticsearch")
-    @patch("notification_api.emails.html")
-    @patch("notification_api.read_configuration")
-    def test_end_to_end_mail_sending(self, mock_read_config, mock_emails_html, mock_elasticsearch):
-        """Test end-to-end mail sending workflow"""
-        mock_config = MagicMock()
-        mock_config.getProperty.side_effect = lambda key: {
-            "elasticsearch.host": "localhost",
-            "elasticsearch.username": "elastic",
-            "elasticsearch.password": "password",
-            "elasticsearch.port": 9200,
-            "smtp.from": "sender@example.com",
-            "smtp.smtp_server": "smtp.example.com",
-            "smtp.smtp_port": 587,
-            "smtp.username": "user@example.com",
-            "smtp.password": "password123",
-        }.get(key)
-        mock_read_config.return_value = mock_config
-        
-        mock_es_instance = MagicMock()
-        mock_elasticsearch.return_value = mock_es_instance
-        mock_es_instance.search.return_value = {
-            "hits": {
-                "hits": [
-                    {"_source": {"email_id": "emp1@example.com"}},
-                    {"_source": {"email_id": "emp2@example.com"}},
-                ]
-            }
+    }
+
+    notification_api.send_mail_to_all_users()
+
+    assert mock_send_mail.call_count == 2
+    mock_send_mail.assert_any_call("user1@example.com")
+    mock_send_mail.assert_any_call("user2@example.com")
+
+
+@pytest.mark.unit
+@pytest.mark.elasticsearch
+def test_send_mail_to_all_users_elasticsearch_connection(mocker, mock_config, smtp_es_config,
+                                                         mock_elasticsearch):
+    """Test elasticsearch connection parameters"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+
+    notification_api.send_mail_to_all_users()
+
+    # Verify elasticsearch connection parameters
+    mock_elasticsearch.assert_called_once()
+    call_args = mock_elasticsearch.call_args
+    assert call_args[0][0] == [smtp_es_config["elasticsearch.host"]]
+    assert call_args.kwargs.get("port") == smtp_es_config["elasticsearch.port"]
+
+
+@pytest.mark.unit
+@pytest.mark.elasticsearch
+def test_send_mail_to_all_users_query(mocker, mock_config, mock_elasticsearch):
+    """Test elasticsearch query parameters"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+
+    mock_es_instance = mock_elasticsearch.return_value
+
+    notification_api.send_mail_to_all_users()
+
+    # Verify elasticsearch search query
+    mock_es_instance.search.assert_called_once()
+    search_call = mock_es_instance.search.call_args
+    assert search_call.kwargs.get("index") == "employee-management"
+
+
+@pytest.mark.unit
+@pytest.mark.elasticsearch
+def test_send_mail_to_all_users_exception(mocker, mock_config, mock_elasticsearch, silent_logger):
+    """Test exception handling in send_mail_to_all_users"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+    mock_elasticsearch.side_effect = Exception("Connection refused")
+
+    notification_api.send_mail_to_all_users()
+
+    silent_logger.error.assert_called()
+
+
+@pytest.mark.unit
+@pytest.mark.elasticsearch
+def test_send_mail_to_all_users_empty_result(mocker, mock_config, mock_elasticsearch):
+    """Test handling empty elasticsearch results"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+    mock_send_mail = mocker.patch("notification_api.send_mail")
+
+    notification_api.send_mail_to_all_users()
+
+    mock_send_mail.assert_not_called()
+
+
+# Schedule operations
+
+@pytest.mark.unit
+@pytest.mark.schedule
+def test_schedule_operation_sets_hourly_schedule(mocker):
+    """Test that schedule_operation sets hourly schedule"""
+    # Mock to stop the infinite loop after one iteration
+    mocker.patch("notification_api.time.sleep", side_effect=KeyboardInterrupt)
+    mock_every = mocker.patch("notification_api.schedule.every")
+    mock_run_pending = mocker.patch("notification_api.schedule.run_pending")
+    mock_every_instance = mock_every.return_value
+
+    with pytest.raises(KeyboardInterrupt):
+        notification_api.schedule_operation()
+
+    mock_every.assert_called()
+    mock_every_instance.hour.do.assert_called_once_with(notification_api.send_mail_to_all_users)
+    mock_run_pending.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.schedule
+def test_schedule_operation_logging(mocker, silent_logger):
+    """Test that schedule_operation logs waiting message"""
+    # Mock to stop after one iteration
+    mocker.patch("notification_api.time.sleep", side_effect=KeyboardInterrupt)
+    mock_every = mocker.patch("notification_api.schedule.every")
+    mock_run_pending = mocker.patch("notification_api.schedule.run_pending")
+
+    with pytest.raises(KeyboardInterrupt):
+        notification_api.schedule_operation()
+
+    mock_every.assert_called()
+    mock_run_pending.assert_called_once()
+    silent_logger.info.assert_called()
+
+
+# Main argument parsing
+
+def test_main_scheduled_mode(mocker):
+    """Test main with scheduled mode"""
+    # run_module executes a fresh copy of the module, so the patches
+    # target the shared schedule and time modules instead
+    mocker.patch("time.sleep", side_effect=KeyboardInterrupt)
+    mock_every = mocker.patch("schedule.every")
+    mock_run_pending = mocker.patch("schedule.run_pending")
+    mocker.patch("sys.argv", ["notification_api.py", "-m", "scheduled"])
+
+    with pytest.raises(KeyboardInterrupt):
+        runpy.run_module("notification_api", run_name="__main__")
+
+    mock_every.return_value.hour.do.assert_called_once()
+    mock_run_pending.assert_called_once()
+
+
+def test_main_external_mode(mocker, mock_config):
+    """Test main with external mode"""
+    # As in scheduled mode, patch the shared modules the fresh copy imports
+    mocker.patch("config_with_yaml.load", return_value=mock_config)
+    mock_es_class = mocker.patch("elasticsearch.Elasticsearch")
+    mock_es_class.return_value.search.return_value = {"hits": {"hits": []}}
+    mock_every = mocker.patch("schedule.every")
+    mocker.patch("sys.argv", ["notification_api.py", "-m", "external"])
+
+    runpy.run_module("notification_api", run_name="__main__")
+
+    mock_es_class.return_value.search.assert_called_once()
+    mock_every.assert_not_called()
+
+
+def test_default_mode_is_scheduled():
+    """Test that default mode is 'scheduled'"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-m", "--mode", help="Mode", default="scheduled")
+
+    # Test with no arguments
+    args = parser.parse_args([])
+    assert args.mode == "scheduled"
+
+
+# Integration
+
+@pytest.mark.integration
+@pytest.mark.smoke
+def test_end_to_end_mail_sending(mocker, mock_config, mock_emails_html, mock_elasticsearch):
+    """Test end-to-end mail sending workflow"""
+    mocker.patch("notification_api.read_configuration", return_value=mock_config)
+
+    mock_es_instance = mock_elasticsearch.return_value
+    mock_es_instance.search.return_value = {
+        "hits": {
+            "hits": [
+                {"_source": {"email_id": "emp1@example.com"}},
+                {"_source": {"email_id": "emp2@example.com"}},
+            ]
         }
-        
-        mock_message = MagicMock()
-        mock_emails_html.return_value = mock_message
-        
-        notification_api.send_mail_to_all_users()
-        
-        self.assertEqual(mock_emails_html.call_count, 2)
-        self.assertEqual(mock_message.send.call_count, 2)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    }
+
+    mock_message = mock_emails_html.return_value
+
+    notification_api.send_mail_to_all_users()
+
+    assert mock_emails_html.call_count == 2
+    assert mock_message.send.call_count == 2